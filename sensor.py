@@ -1,8 +1,11 @@
 """Support for Huawei inverter monitoring API."""
 
 from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Any, cast
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import product
+from operator import attrgetter, itemgetter
+from typing import Any
 
 from huawei_solar import (
     HuaweiEMMABridge,
@@ -13,7 +16,6 @@ from huawei_solar import (
 )
 from huawei_solar.files import OptimizerRunningStatus
 from huawei_solar.registers import (
-    ChargeDischargePeriod,
     ChargeFlag,
     HUAWEI_LUNA2000_TimeOfUsePeriod,
     LG_RESU_TimeOfUsePeriod,
@@ -58,6 +60,7 @@ class HuaweiSolarSensorEntityDescription(SensorEntityDescription):
     """Huawei Solar Sensor Entity."""
 
     value_conversion_function: Callable[[Any], str] | None = None
+    register_key: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Defaults the translation_key to the sensor key."""
@@ -71,114 +74,128 @@ class HuaweiSolarSensorEntityDescription(SensorEntityDescription):
             self.translation_key or self.key.replace("#", "_").lower(),
         )
 
+        # Keys of the form "<register name>#<index>" select a value from a register
+        object.__setattr__(self, "register_key", self.key.partition("#")[0])
+
+        # The context is requested by the DataUpdateCoordinator for every entity on
+        # every update, so we only compute it once.
+        object.__setattr__(self, "_context", {"register_names": [self.register_key]})
+
     @property
     def context(self):
         """Context used by DataUpdateCoordinator."""
-        return {"register_names": [self.key.split("#")[0]]}
+        return self._context
 
 
-# Every list in this file describes a group of entities which are related to each other.
-# The order of these lists matters, as they need to be in ascending order wrt. to their modbus-register.
+def _voltage_description(key: str, **kwargs: Any) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription(
+        key=key,
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        **kwargs,
+    )
 
 
-INVERTER_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = (
-    HuaweiSolarSensorEntityDescription(
-        key=rn.RATED_POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.P_MAX,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
+def _current_description(key: str, **kwargs: Any) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription(
+        key=key,
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.INPUT_POWER,
+        **kwargs,
+    )
+
+
+def _power_description(key: str, **kwargs: Any) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription(
+        key=key,
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.LINE_VOLTAGE_A_B,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.LINE_VOLTAGE_B_C,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.LINE_VOLTAGE_C_A,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PHASE_A_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PHASE_B_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PHASE_C_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PHASE_A_CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
+        **kwargs,
+    )
+
+
+def _temperature_description(
+    key: str, **kwargs: Any
+) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription(
+        key=key,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PHASE_B_CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
+        **kwargs,
+    )
+
+
+def _frequency_description(
+    key: str, **kwargs: Any
+) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription(
+        key=key,
+        native_unit_of_measurement=UnitOfFrequency.HERTZ,
+        device_class=SensorDeviceClass.FREQUENCY,
         state_class=SensorStateClass.MEASUREMENT,
+        **kwargs,
+    )
+
+
+def _energy_description(
+    key: str,
+    state_class: SensorStateClass = SensorStateClass.TOTAL_INCREASING,
+    **kwargs: Any,
+) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription(
+        key=key,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=state_class,
+        **kwargs,
+    )
+
+
+def _energy_storage_description(
+    key: str,
+    state_class: SensorStateClass = SensorStateClass.MEASUREMENT,
+    **kwargs: Any,
+) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription(
+        key=key,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY_STORAGE,
+        state_class=state_class,
+        **kwargs,
+    )
+
+
+# Every list in this file describes a group of entities which are related to each other.
+# The order of these lists matters, as they need to be in ascending order wrt. to their modbus-register.
+
+
+INVERTER_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = (
+    _power_description(
+        rn.RATED_POWER,
+        entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PHASE_C_CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
+    _power_description(
+        rn.P_MAX,
+        entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.DAY_ACTIVE_POWER_PEAK,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
+    _power_description(rn.INPUT_POWER),
+    _voltage_description(rn.LINE_VOLTAGE_A_B, entity_registry_enabled_default=False),
+    _voltage_description(rn.LINE_VOLTAGE_B_C, entity_registry_enabled_default=False),
+    _voltage_description(rn.LINE_VOLTAGE_C_A, entity_registry_enabled_default=False),
+    _voltage_description(rn.PHASE_A_VOLTAGE, entity_registry_enabled_default=False),
+    _voltage_description(rn.PHASE_B_VOLTAGE, entity_registry_enabled_default=False),
+    _voltage_description(rn.PHASE_C_VOLTAGE, entity_registry_enabled_default=False),
+    _current_description(rn.PHASE_A_CURRENT, entity_registry_enabled_default=False),
+    _current_description(rn.PHASE_B_CURRENT, entity_registry_enabled_default=False),
+    _current_description(rn.PHASE_C_CURRENT, entity_registry_enabled_default=False),
+    _power_description(rn.DAY_ACTIVE_POWER_PEAK),
+    _power_description(rn.ACTIVE_POWER),
     HuaweiSolarSensorEntityDescription(
         key=rn.REACTIVE_POWER,
         native_unit_of_measurement=UnitOfReactivePower.VOLT_AMPERE_REACTIVE,
@@ -197,12 +214,8 @@ INVERTER_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.INTERNAL_TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
+    _temperature_description(
+        rn.INTERNAL_TEMPERATURE, entity_registry_enabled_default=False
     ),
     HuaweiSolarSensorEntityDescription(
         key=rn.INSULATION_RESISTANCE,
@@ -227,38 +240,18 @@ INVERTER_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACCUMULATED_YIELD_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.TOTAL_DC_INPUT_POWER,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL,
+    _energy_description(
+        rn.ACCUMULATED_YIELD_ENERGY, state_class=SensorStateClass.TOTAL
     ),
+    _energy_description(rn.TOTAL_DC_INPUT_POWER, state_class=SensorStateClass.TOTAL),
     HuaweiSolarSensorEntityDescription(
         key=rn.CURRENT_ELECTRICITY_GENERATION_STATISTICS_TIME,
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.HOURLY_YIELD_ENERGY,
-        icon="mdi:solar-power",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.DAILY_YIELD_ENERGY,
-        icon="mdi:solar-power",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
+    _energy_description(rn.HOURLY_YIELD_ENERGY, icon="mdi:solar-power"),
+    _energy_description(rn.DAILY_YIELD_ENERGY, icon="mdi:solar-power"),
     HuaweiSolarSensorEntityDescription(
         key=rn.STATE_1,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -267,27 +260,27 @@ INVERTER_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = (
     HuaweiSolarSensorEntityDescription(
         key=f"{rn.STATE_2}#0",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_conversion_function=lambda value: value[0],
+        value_conversion_function=itemgetter(0),
     ),
     HuaweiSolarSensorEntityDescription(
         key=f"{rn.STATE_2}#1",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_conversion_function=lambda value: value[1],
+        value_conversion_function=itemgetter(1),
     ),
     HuaweiSolarSensorEntityDescription(
         key=f"{rn.STATE_2}#2",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_conversion_function=lambda value: value[2],
+        value_conversion_function=itemgetter(2),
     ),
     HuaweiSolarSensorEntityDescription(
         key=f"{rn.STATE_3}#0",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_conversion_function=lambda value: value[0],
+        value_conversion_function=itemgetter(0),
     ),
     HuaweiSolarSensorEntityDescription(
         key=f"{rn.STATE_3}#1",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_conversion_function=lambda value: value[1],
+        value_conversion_function=itemgetter(1),
     ),
 )
 
@@ -299,68 +292,32 @@ OPTIMIZER_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] =
     ),
 )
 
+
+def _optimizer_alarms_to_str(alarms: list[str]) -> str:
+    return ", ".join(alarms) or "None"
+
+
 OPTIMIZER_DETAIL_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = (
-    HuaweiSolarSensorEntityDescription(
-        key="output_power",
-        icon="mdi:flash",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key="voltage_to_ground",
+    _power_description("output_power", icon="mdi:flash"),
+    _voltage_description(
+        "voltage_to_ground",
         icon="mdi:lightning-bolt",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key="output_voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key="output_current",
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key="input_voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key="input_current",
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key="temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
+    _voltage_description("output_voltage"),
+    _current_description("output_current"),
+    _voltage_description("input_voltage"),
+    _current_description("input_current"),
+    _temperature_description("temperature"),
     HuaweiSolarSensorEntityDescription(
         key="running_status",
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key="accumulated_energy_yield",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL,
-    ),
+    _energy_description("accumulated_energy_yield", state_class=SensorStateClass.TOTAL),
     HuaweiSolarSensorEntityDescription(
         key="alarm",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_conversion_function=lambda alarms: ", ".join(alarms)
-        if len(alarms)
-        else "None",
+        value_conversion_function=_optimizer_alarms_to_str,
         icon="mdi:alarm-light",
     ),
 )
@@ -375,28 +332,15 @@ SINGLE_PHASE_METER_ENTITY_DESCRIPTIONS: tuple[
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_A_VOLTAGE,
+    _voltage_description(
+        rn.GRID_A_VOLTAGE,
         translation_key="single_phase_voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_A_CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.POWER_METER_ACTIVE_POWER,
-        icon="mdi:flash",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
+    _current_description(
+        rn.ACTIVE_GRID_A_CURRENT, entity_registry_enabled_default=False
     ),
+    _power_description(rn.POWER_METER_ACTIVE_POWER, icon="mdi:flash"),
     HuaweiSolarSensorEntityDescription(
         key=rn.POWER_METER_REACTIVE_POWER,
         icon="mdi:flash",
@@ -410,25 +354,11 @@ SINGLE_PHASE_METER_ENTITY_DESCRIPTIONS: tuple[
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_FREQUENCY,
-        native_unit_of_measurement=UnitOfFrequency.HERTZ,
-        device_class=SensorDeviceClass.FREQUENCY,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_EXPORTED_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_ACCUMULATED_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
+    _frequency_description(
+        rn.ACTIVE_GRID_FREQUENCY, entity_registry_enabled_default=False
     ),
+    _energy_description(rn.GRID_EXPORTED_ENERGY),
+    _energy_description(rn.GRID_ACCUMULATED_ENERGY),
     HuaweiSolarSensorEntityDescription(
         key=rn.GRID_ACCUMULATED_REACTIVE_POWER,
         native_unit_of_measurement="kVarh",
@@ -450,55 +380,19 @@ THREE_PHASE_METER_ENTITY_DESCRIPTIONS: tuple[
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_A_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
+    _voltage_description(rn.GRID_A_VOLTAGE, entity_registry_enabled_default=False),
+    _voltage_description(rn.GRID_B_VOLTAGE, entity_registry_enabled_default=False),
+    _voltage_description(rn.GRID_C_VOLTAGE, entity_registry_enabled_default=False),
+    _current_description(
+        rn.ACTIVE_GRID_A_CURRENT, entity_registry_enabled_default=False
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_B_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_C_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
+    _current_description(
+        rn.ACTIVE_GRID_B_CURRENT, entity_registry_enabled_default=False
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_A_CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_B_CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_C_CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.POWER_METER_ACTIVE_POWER,
-        icon="mdi:flash",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
+    _current_description(
+        rn.ACTIVE_GRID_C_CURRENT, entity_registry_enabled_default=False
     ),
+    _power_description(rn.POWER_METER_ACTIVE_POWER, icon="mdi:flash"),
     HuaweiSolarSensorEntityDescription(
         key=rn.POWER_METER_REACTIVE_POWER,
         icon="mdi:flash",
@@ -512,24 +406,9 @@ THREE_PHASE_METER_ENTITY_DESCRIPTIONS: tuple[
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_FREQUENCY,
-        native_unit_of_measurement=UnitOfFrequency.HERTZ,
-        device_class=SensorDeviceClass.FREQUENCY,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_EXPORTED_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_ACCUMULATED_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
+    _frequency_description(rn.ACTIVE_GRID_FREQUENCY),
+    _energy_description(rn.GRID_EXPORTED_ENERGY),
+    _energy_description(rn.GRID_ACCUMULATED_ENERGY),
     HuaweiSolarSensorEntityDescription(
         key=rn.GRID_ACCUMULATED_REACTIVE_POWER,
         native_unit_of_measurement="kVarh",
@@ -539,66 +418,37 @@ THREE_PHASE_METER_ENTITY_DESCRIPTIONS: tuple[
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_A_B_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
+    _voltage_description(
+        rn.ACTIVE_GRID_A_B_VOLTAGE, entity_registry_enabled_default=False
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_B_C_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
+    _voltage_description(
+        rn.ACTIVE_GRID_B_C_VOLTAGE, entity_registry_enabled_default=False
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_C_A_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_A_POWER,
-        icon="mdi:flash",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_B_POWER,
-        icon="mdi:flash",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_C_POWER,
-        icon="mdi:flash",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
+    _voltage_description(
+        rn.ACTIVE_GRID_C_A_VOLTAGE, entity_registry_enabled_default=False
     ),
+    _power_description(rn.ACTIVE_GRID_A_POWER, icon="mdi:flash"),
+    _power_description(rn.ACTIVE_GRID_B_POWER, icon="mdi:flash"),
+    _power_description(rn.ACTIVE_GRID_C_POWER, icon="mdi:flash"),
 )
 
+METER_ENTITY_DESCRIPTIONS: dict[
+    rv.MeterType, tuple[HuaweiSolarSensorEntityDescription, ...]
+] = {
+    rv.MeterType.SINGLE_PHASE: SINGLE_PHASE_METER_ENTITY_DESCRIPTIONS,
+    rv.MeterType.THREE_PHASE: THREE_PHASE_METER_ENTITY_DESCRIPTIONS,
+}
+
 BATTERIES_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = (
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_MAXIMUM_CHARGE_POWER,
+    _power_description(
+        rn.STORAGE_MAXIMUM_CHARGE_POWER,
         icon="mdi:battery-plus-variant",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.POWER,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_MAXIMUM_DISCHARGE_POWER,
+    _power_description(
+        rn.STORAGE_MAXIMUM_DISCHARGE_POWER,
         icon="mdi:battery-minus-variant",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.POWER,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
@@ -620,59 +470,33 @@ BATTERIES_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] =
         key=rn.STORAGE_RUNNING_STATUS,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_BUS_VOLTAGE,
-        icon="mdi:home-lightning-bolt",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_BUS_CURRENT,
-        icon="mdi:home-lightning-bolt-outline",
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
+    _voltage_description(rn.STORAGE_BUS_VOLTAGE, icon="mdi:home-lightning-bolt"),
+    _current_description(
+        rn.STORAGE_BUS_CURRENT, icon="mdi:home-lightning-bolt-outline"
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_CHARGE_DISCHARGE_POWER,
-        icon="mdi:home-battery-outline",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.POWER,
+    _power_description(
+        rn.STORAGE_CHARGE_DISCHARGE_POWER, icon="mdi:home-battery-outline"
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_TOTAL_CHARGE,
-        icon="mdi:battery-plus-variant",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+    _energy_description(
+        rn.STORAGE_TOTAL_CHARGE,
         state_class=SensorStateClass.TOTAL,
-        device_class=SensorDeviceClass.ENERGY,
+        icon="mdi:battery-plus-variant",
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_TOTAL_DISCHARGE,
-        icon="mdi:battery-minus-variant",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+    _energy_description(
+        rn.STORAGE_TOTAL_DISCHARGE,
         state_class=SensorStateClass.TOTAL,
-        device_class=SensorDeviceClass.ENERGY,
+        icon="mdi:battery-minus-variant",
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_CURRENT_DAY_CHARGE_CAPACITY,
-        icon="mdi:battery-plus-variant",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-        device_class=SensorDeviceClass.ENERGY,
+    _energy_description(
+        rn.STORAGE_CURRENT_DAY_CHARGE_CAPACITY, icon="mdi:battery-plus-variant"
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_CURRENT_DAY_DISCHARGE_CAPACITY,
-        icon="mdi:battery-minus-variant",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-        device_class=SensorDeviceClass.ENERGY,
+    _energy_description(
+        rn.STORAGE_CURRENT_DAY_DISCHARGE_CAPACITY, icon="mdi:battery-minus-variant"
     ),
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatteryTemplateEntityDescription:
     """Template for Huawei Solar Battery Sensor Entity Description."""
 
@@ -784,53 +608,20 @@ BATTERY_TEMPLATE_SENSOR_DESCRIPTIONS: tuple[BatteryTemplateEntityDescription, ..
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.POWER,
     ),
-    BatteryTemplateEntityDescription(
-        battery_1_key=rn.STORAGE_UNIT_1_BATTERY_PACK_1_MAXIMUM_TEMPERATURE,
-        battery_2_key=rn.STORAGE_UNIT_2_BATTERY_PACK_1_MAXIMUM_TEMPERATURE,
-        translation_key="pack_1_max_temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    BatteryTemplateEntityDescription(
-        battery_1_key=rn.STORAGE_UNIT_1_BATTERY_PACK_1_MINIMUM_TEMPERATURE,
-        battery_2_key=rn.STORAGE_UNIT_2_BATTERY_PACK_1_MINIMUM_TEMPERATURE,
-        translation_key="pack_1_min_temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    BatteryTemplateEntityDescription(
-        battery_1_key=rn.STORAGE_UNIT_1_BATTERY_PACK_2_MAXIMUM_TEMPERATURE,
-        battery_2_key=rn.STORAGE_UNIT_2_BATTERY_PACK_2_MAXIMUM_TEMPERATURE,
-        translation_key="pack_2_max_temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    BatteryTemplateEntityDescription(
-        battery_1_key=rn.STORAGE_UNIT_1_BATTERY_PACK_2_MINIMUM_TEMPERATURE,
-        battery_2_key=rn.STORAGE_UNIT_2_BATTERY_PACK_2_MINIMUM_TEMPERATURE,
-        translation_key="pack_2_min_temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    BatteryTemplateEntityDescription(
-        battery_1_key=rn.STORAGE_UNIT_1_BATTERY_PACK_3_MAXIMUM_TEMPERATURE,
-        battery_2_key=rn.STORAGE_UNIT_2_BATTERY_PACK_3_MAXIMUM_TEMPERATURE,
-        translation_key="pack_3_max_temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-    ),
-    BatteryTemplateEntityDescription(
-        battery_1_key=rn.STORAGE_UNIT_1_BATTERY_PACK_3_MINIMUM_TEMPERATURE,
-        battery_2_key=rn.STORAGE_UNIT_2_BATTERY_PACK_3_MINIMUM_TEMPERATURE,
-        translation_key="pack_3_min_temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.TEMPERATURE,
+    *(
+        BatteryTemplateEntityDescription(
+            battery_1_key=getattr(
+                rn, f"STORAGE_UNIT_1_BATTERY_PACK_{pack}_{extreme}_TEMPERATURE"
+            ),
+            battery_2_key=getattr(
+                rn, f"STORAGE_UNIT_2_BATTERY_PACK_{pack}_{extreme}_TEMPERATURE"
+            ),
+            translation_key=f"pack_{pack}_{extreme[:3].lower()}_temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            state_class=SensorStateClass.MEASUREMENT,
+            device_class=SensorDeviceClass.TEMPERATURE,
+        )
+        for pack, extreme in product((1, 2, 3), ("MAXIMUM", "MINIMUM"))
     ),
     BatteryTemplateEntityDescription(
         battery_1_key=rn.STORAGE_UNIT_1_BATTERY_PACK_1_WORKING_STATUS,
@@ -847,340 +638,225 @@ BATTERY_TEMPLATE_SENSOR_DESCRIPTIONS: tuple[BatteryTemplateEntityDescription, ..
 )
 
 
+def _battery_entity_descriptions(
+    battery_key_attribute: str,
+) -> tuple[HuaweiSolarSensorEntityDescription, ...]:
+    return tuple(
+        HuaweiSolarSensorEntityDescription(
+            key=battery_key,
+            translation_key=entity_description_template.translation_key,
+            device_class=entity_description_template.device_class,
+            state_class=entity_description_template.state_class,
+            native_unit_of_measurement=entity_description_template.native_unit_of_measurement,
+            icon=entity_description_template.icon,
+            entity_category=entity_description_template.entity_category,
+            entity_registry_enabled_default=False,
+        )
+        for entity_description_template in BATTERY_TEMPLATE_SENSOR_DESCRIPTIONS
+        if (battery_key := getattr(entity_description_template, battery_key_attribute))
+    )
+
+
+BATTERY_1_SENSOR_DESCRIPTIONS = _battery_entity_descriptions("battery_1_key")
+BATTERY_2_SENSOR_DESCRIPTIONS = _battery_entity_descriptions("battery_2_key")
+
+
 def create_sun2000_entities(ucs: HuaweiSolarUpdateCoordinators) -> list[SensorEntity]:
     """Create SUN2000 sensor entities."""
     entities_to_add = []
-    assert ucs.device_infos["inverter"]
-    assert isinstance(ucs.bridge, HuaweiSUN2000Bridge)
+    inverter_update_coordinator = ucs.inverter_update_coordinator
+    inverter_device_info = ucs.device_infos["inverter"]
+    configuration_update_coordinator = ucs.configuration_update_coordinator
+    bridge = ucs.bridge
+    assert inverter_device_info
+    assert isinstance(bridge, HuaweiSUN2000Bridge)
 
     entities_to_add.extend(
         HuaweiSolarSensorEntity(
-            ucs.inverter_update_coordinator,
+            inverter_update_coordinator,
             entity_description,
-            ucs.device_infos["inverter"],
+            inverter_device_info,
         )
         for entity_description in INVERTER_SENSOR_DESCRIPTIONS
     )
     entities_to_add.append(
-        HuaweiSolarAlarmSensorEntity(
-            ucs.inverter_update_coordinator, ucs.device_infos["inverter"]
-        )
+        HuaweiSolarAlarmSensorEntity(inverter_update_coordinator, inverter_device_info)
     )
 
     entities_to_add.extend(
         HuaweiSolarSensorEntity(
-            ucs.inverter_update_coordinator,
+            inverter_update_coordinator,
             entity_description,
-            ucs.device_infos["inverter"],
+            inverter_device_info,
         )
-        for entity_description in get_pv_entity_descriptions(ucs.bridge.pv_string_count)
+        for entity_description in get_pv_entity_descriptions(bridge.pv_string_count)
     )
 
-    if ucs.bridge.has_optimizers:
+    if bridge.has_optimizers:
         entities_to_add.extend(
             HuaweiSolarSensorEntity(
-                ucs.inverter_update_coordinator,
+                inverter_update_coordinator,
                 entity_description,
-                ucs.device_infos["inverter"],
+                inverter_device_info,
             )
             for entity_description in OPTIMIZER_SENSOR_DESCRIPTIONS
         )
 
-    if ucs.bridge.power_meter_type == rv.MeterType.SINGLE_PHASE:
-        assert ucs.power_meter_update_coordinator
-        assert ucs.device_infos["power_meter"]
-        entities_to_add.extend(
-            HuaweiSolarSensorEntity(
-                ucs.power_meter_update_coordinator,
-                entity_description,
-                ucs.device_infos["power_meter"],
-            )
-            for entity_description in SINGLE_PHASE_METER_ENTITY_DESCRIPTIONS
-        )
-
-    elif ucs.bridge.power_meter_type == rv.MeterType.THREE_PHASE:
-        assert ucs.power_meter_update_coordinator
-        assert ucs.device_infos["power_meter"]
+    if meter_entity_descriptions := METER_ENTITY_DESCRIPTIONS.get(
+        bridge.power_meter_type
+    ):
+        power_meter_update_coordinator = ucs.power_meter_update_coordinator
+        power_meter_device_info = ucs.device_infos["power_meter"]
+        assert power_meter_update_coordinator
+        assert power_meter_device_info
         entities_to_add.extend(
             HuaweiSolarSensorEntity(
-                ucs.power_meter_update_coordinator,
+                power_meter_update_coordinator,
                 entity_description,
-                ucs.device_infos["power_meter"],
+                power_meter_device_info,
             )
-            for entity_description in THREE_PHASE_METER_ENTITY_DESCRIPTIONS
+            for entity_description in meter_entity_descriptions
         )
 
-    if ucs.bridge.has_write_permission and ucs.configuration_update_coordinator:
+    # The configuration coordinator is only created when parameter configuration is
+    # enabled, which the config flow only allows after write access was verified.
+    if configuration_update_coordinator:
         entities_to_add.append(
             HuaweiSolarActivePowerControlModeEntity(
-                ucs.configuration_update_coordinator,
-                ucs.bridge,
-                ucs.device_infos["inverter"],
+                configuration_update_coordinator,
+                bridge,
+                inverter_device_info,
             )
         )
 
-    if ucs.bridge.battery_type != rv.StorageProductModel.NONE:
-        assert ucs.energy_storage_update_coordinator
-        assert ucs.device_infos["connected_energy_storage"]
+    if bridge.battery_type != rv.StorageProductModel.NONE:
+        energy_storage_update_coordinator = ucs.energy_storage_update_coordinator
+        energy_storage_device_info = ucs.device_infos["connected_energy_storage"]
+        assert energy_storage_update_coordinator
+        assert energy_storage_device_info
 
         entities_to_add.extend(
             HuaweiSolarSensorEntity(
-                ucs.energy_storage_update_coordinator,
+                energy_storage_update_coordinator,
                 entity_description,
-                ucs.device_infos["connected_energy_storage"],
+                energy_storage_device_info,
             )
             for entity_description in BATTERIES_SENSOR_DESCRIPTIONS
         )
 
-        if ucs.configuration_update_coordinator:
+        if configuration_update_coordinator:
             entities_to_add.extend(
                 [
                     HuaweiSolarTOUPricePeriodsSensorEntity(
-                        ucs.configuration_update_coordinator,
-                        ucs.bridge,
-                        ucs.device_infos["connected_energy_storage"],
+                        configuration_update_coordinator,
+                        bridge,
+                        energy_storage_device_info,
                     ),
                     HuaweiSolarForcibleChargeEntity(
-                        ucs.configuration_update_coordinator,
-                        ucs.configuration_update_coordinator.bridge,
-                        ucs.device_infos["connected_energy_storage"],
+                        configuration_update_coordinator,
+                        bridge,
+                        energy_storage_device_info,
                     ),
                 ]
             )
 
-            if ucs.bridge.supports_capacity_control:
+            if bridge.supports_capacity_control:
                 entities_to_add.append(
                     HuaweiSolarCapacityControlPeriodsSensorEntity(
-                        ucs.configuration_update_coordinator,
-                        ucs.configuration_update_coordinator.bridge,
-                        ucs.device_infos["connected_energy_storage"],
+                        configuration_update_coordinator,
+                        bridge,
+                        energy_storage_device_info,
                     )
                 )
 
-        if ucs.device_infos["battery_1"]:
+        if battery_1_device_info := ucs.device_infos["battery_1"]:
             entities_to_add.extend(
                 HuaweiSolarSensorEntity(
-                    ucs.energy_storage_update_coordinator,
-                    HuaweiSolarSensorEntityDescription(
-                        key=entity_description_template.battery_1_key,
-                        translation_key=entity_description_template.translation_key,
-                        device_class=entity_description_template.device_class,
-                        state_class=entity_description_template.state_class,
-                        native_unit_of_measurement=entity_description_template.native_unit_of_measurement,
-                        icon=entity_description_template.icon,
-                        entity_category=entity_description_template.entity_category,
-                        entity_registry_enabled_default=False,
-                    ),
-                    ucs.device_infos["battery_1"],
+                    energy_storage_update_coordinator,
+                    entity_description,
+                    battery_1_device_info,
                 )
-                for entity_description_template in BATTERY_TEMPLATE_SENSOR_DESCRIPTIONS
-                if entity_description_template.battery_1_key
+                for entity_description in BATTERY_1_SENSOR_DESCRIPTIONS
             )
 
-        if ucs.device_infos["battery_2"]:
+        if battery_2_device_info := ucs.device_infos["battery_2"]:
             entities_to_add.extend(
                 HuaweiSolarSensorEntity(
-                    ucs.energy_storage_update_coordinator,
-                    HuaweiSolarSensorEntityDescription(
-                        key=entity_description_template.battery_2_key,
-                        translation_key=entity_description_template.translation_key,
-                        device_class=entity_description_template.device_class,
-                        state_class=entity_description_template.state_class,
-                        native_unit_of_measurement=entity_description_template.native_unit_of_measurement,
-                        icon=entity_description_template.icon,
-                        entity_category=entity_description_template.entity_category,
-                        entity_registry_enabled_default=False,
-                    ),
-                    ucs.device_infos["battery_2"],
+                    energy_storage_update_coordinator,
+                    entity_description,
+                    battery_2_device_info,
                 )
-                for entity_description_template in BATTERY_TEMPLATE_SENSOR_DESCRIPTIONS
-                if entity_description_template.battery_2_key
+                for entity_description in BATTERY_2_SENSOR_DESCRIPTIONS
             )
-    if ucs.optimizer_update_coordinator:
-        optimizer_device_infos = ucs.optimizer_update_coordinator.optimizer_device_infos
+    if optimizer_update_coordinator := ucs.optimizer_update_coordinator:
+        optimizer_device_infos = optimizer_update_coordinator.optimizer_device_infos
 
         entities_to_add.extend(
             HuaweiSolarOptimizerSensorEntity(
-                ucs.optimizer_update_coordinator,
+                optimizer_update_coordinator,
                 entity_description,
                 optimizer_id,
                 device_info,
             )
-            for optimizer_id, device_info in optimizer_device_infos.items()
-            for entity_description in OPTIMIZER_DETAIL_SENSOR_DESCRIPTIONS
+            for (optimizer_id, device_info), entity_description in product(
+                optimizer_device_infos.items(), OPTIMIZER_DETAIL_SENSOR_DESCRIPTIONS
+            )
         )
 
     return entities_to_add
 
 
 EMMA_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = (
-    HuaweiSolarSensorEntityDescription(
-        key=rn.INVERTER_TOTAL_ABSORBED_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ENERGY_CHARGED_TODAY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.TOTAL_CHARGED_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL,
+    _energy_description(
+        rn.INVERTER_TOTAL_ABSORBED_ENERGY, state_class=SensorStateClass.TOTAL
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ENERGY_DISCHARGED_TODAY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.TOTAL_DISCHARGED_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ESS_CHARGEABLE_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY_STORAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ESS_DISCHARGEABLE_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY_STORAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
+    _energy_description(rn.ENERGY_CHARGED_TODAY),
+    _energy_description(rn.TOTAL_CHARGED_ENERGY, state_class=SensorStateClass.TOTAL),
+    _energy_description(rn.ENERGY_DISCHARGED_TODAY),
+    _energy_description(rn.TOTAL_DISCHARGED_ENERGY),
+    _energy_storage_description(
+        rn.ESS_CHARGEABLE_ENERGY, entity_registry_enabled_default=False
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.RATED_ESS_CAPACITY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY_STORAGE,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-        entity_registry_enabled_default=False,
+    _energy_storage_description(
+        rn.ESS_DISCHARGEABLE_ENERGY, entity_registry_enabled_default=False
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.CONSUMPTION_TODAY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
+    _energy_storage_description(
+        rn.RATED_ESS_CAPACITY,
         state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.TOTAL_ENERGY_CONSUMPTION,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.FEED_IN_TO_GRID_TODAY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.TOTAL_FEED_IN_TO_GRID,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.SUPPLY_FROM_GRID_TODAY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.TOTAL_SUPPLY_FROM_GRID,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.INVERTER_ENERGY_YIELD_TODAY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.INVERTER_TOTAL_ENERGY_YIELD,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PV_YIELD_TODAY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.TOTAL_PV_ENERGY_YIELD,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
+    _energy_description(rn.CONSUMPTION_TODAY),
+    _energy_description(
+        rn.TOTAL_ENERGY_CONSUMPTION,
         state_class=SensorStateClass.TOTAL,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PV_OUTPUT_POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.LOAD_POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.FEED_IN_POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.BATTERY_CHARGE_DISCHARGE_POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.INVERTER_RATED_POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.INVERTER_ACTIVE_POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
+    _energy_description(rn.FEED_IN_TO_GRID_TODAY),
+    _energy_description(rn.TOTAL_FEED_IN_TO_GRID, state_class=SensorStateClass.TOTAL),
+    _energy_description(rn.SUPPLY_FROM_GRID_TODAY),
+    _energy_description(rn.TOTAL_SUPPLY_FROM_GRID, state_class=SensorStateClass.TOTAL),
+    _energy_description(rn.INVERTER_ENERGY_YIELD_TODAY),
+    _energy_description(
+        rn.INVERTER_TOTAL_ENERGY_YIELD, state_class=SensorStateClass.TOTAL
+    ),
+    _energy_description(rn.PV_YIELD_TODAY),
+    _energy_description(rn.TOTAL_PV_ENERGY_YIELD, state_class=SensorStateClass.TOTAL),
+    _power_description(rn.PV_OUTPUT_POWER),
+    _power_description(rn.LOAD_POWER),
+    _power_description(rn.FEED_IN_POWER),
+    _power_description(rn.BATTERY_CHARGE_DISCHARGE_POWER),
+    _power_description(rn.INVERTER_RATED_POWER, entity_registry_enabled_default=False),
+    _power_description(rn.INVERTER_ACTIVE_POWER),
     HuaweiSolarSensorEntityDescription(
         key=rn.STATE_OF_CAPACITY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ESS_CHARGEABLE_CAPACITY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY_STORAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
+    _energy_storage_description(
+        rn.ESS_CHARGEABLE_CAPACITY, entity_registry_enabled_default=False
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ESS_DISCHARGEABLE_CAPACITY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY_STORAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
+    _energy_storage_description(
+        rn.ESS_DISCHARGEABLE_CAPACITY, entity_registry_enabled_default=False
     ),
     HuaweiSolarSensorEntityDescription(
         key=rn.BACKUP_POWER_STATE_OF_CHARGE,
@@ -1228,7 +904,32 @@ async def async_setup_entry(
     async_add_entities(entities_to_add, True)
 
 
-class HuaweiSolarSensorEntity(CoordinatorEntity, HuaweiSolarEntity, SensorEntity):
+class HuaweiSolarBaseSensorEntity(CoordinatorEntity, HuaweiSolarEntity, SensorEntity):
+    """Base class for Huawei Solar Sensors which are fed by a DataUpdateCoordinator."""
+
+    _last_written_state: tuple[Any, ...] | None = None
+
+    @callback
+    def async_write_ha_state_if_changed(self) -> None:
+        """Write the state to Home Assistant if it changed since the last write.
+
+        Most registers are polled far more often than their value changes, so this
+        avoids firing a state update for every entity on every poll.
+        """
+        attributes = self.extra_state_attributes
+        state = (
+            self.available,
+            self.native_value,
+            dict(attributes) if attributes is not None else None,
+        )
+        if state == self._last_written_state:
+            return
+
+        self._last_written_state = state
+        self.async_write_ha_state()
+
+
+class HuaweiSolarSensorEntity(HuaweiSolarBaseSensorEntity):
     """Huawei Solar Sensor which receives its data via an DataUpdateCoordinator."""
 
     entity_description: HuaweiSolarSensorEntityDescription
@@ -1249,18 +950,18 @@ class HuaweiSolarSensorEntity(CoordinatorEntity, HuaweiSolarEntity, SensorEntity
         self._attr_device_info = device_info
         self._attr_unique_id = f"{coordinator.bridge.serial_number}_{description.key}"
 
-        self._register_key = self.entity_description.key
-        if "#" in self._register_key:
-            self._register_key = self._register_key[0 : self._register_key.find("#")]
+        self._register_key = description.register_key
+        self._value_conversion_function = description.value_conversion_function
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data and self._register_key in self.coordinator.data:
-            value = self.coordinator.data[self._register_key].value
+        data = self.coordinator.data
+        if data and (result := data.get(self._register_key)) is not None:
+            value = result.value
 
-            if self.entity_description.value_conversion_function:
-                value = self.entity_description.value_conversion_function(value)
+            if self._value_conversion_function:
+                value = self._value_conversion_function(value)
 
             self._attr_native_value = value
             self._attr_available = True
@@ -1268,7 +969,7 @@ class HuaweiSolarSensorEntity(CoordinatorEntity, HuaweiSolarEntity, SensorEntity
             self._attr_available = False
             self._attr_native_value = None
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
 
 
 class HuaweiSolarAlarmSensorEntity(HuaweiSolarSensorEntity):
@@ -1277,7 +978,7 @@ class HuaweiSolarAlarmSensorEntity(HuaweiSolarSensorEntity):
     These are spread over three registers that are received by the DataUpdateCoordinator.
     """
 
-    ALARM_REGISTERS = [rn.ALARM_1, rn.ALARM_2, rn.ALARM_3]
+    ALARM_REGISTERS = (rn.ALARM_1, rn.ALARM_2, rn.ALARM_3)
 
     DESCRIPTION = HuaweiSolarSensorEntityDescription(
         key="ALARMS",
@@ -1302,49 +1003,65 @@ class HuaweiSolarAlarmSensorEntity(HuaweiSolarSensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         available = False
+        data = self.coordinator.data
 
-        if self.coordinator.data:
-            alarms: list[rv.Alarm] = []
-            for alarm_register in HuaweiSolarAlarmSensorEntity.ALARM_REGISTERS:
-                alarm_register = self.coordinator.data.get(alarm_register)
-                if alarm_register:
-                    available = True
-                    alarms.extend(alarm_register.value)
-            if len(alarms) == 0:
-                self._attr_native_value = "None"
-            else:
-                self._attr_native_value = ", ".join(
-                    [f"[{alarm.level}] {alarm.id}: {alarm.name}" for alarm in alarms]
+        if data:
+            alarm_results = [
+                alarm_result
+                for alarm_result in map(
+                    data.get, HuaweiSolarAlarmSensorEntity.ALARM_REGISTERS
+                )
+                if alarm_result
+            ]
+            available = bool(alarm_results)
+            self._attr_native_value = (
+                ", ".join(
+                    [
+                        f"[{alarm.level}] {alarm.id}: {alarm.name}"
+                        for alarm_result in alarm_results
+                        for alarm in alarm_result.value
+                    ]
                 )
+                or "None"
+            )
         else:
             self._attr_native_value = None
 
         self._attr_available = available
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
 
 
+@lru_cache(maxsize=128)
 def _days_effective_to_str(days: tuple[bool, bool, bool, bool, bool, bool, bool]):
-    value = ""
-    for i in range(7):  # Sunday is on index 0, but we want to name it day 7
-        if days[(i + 1) % 7]:
-            value += f"{i+1}"
+    # Sunday is on index 0, but we want to name it day 7
+    return "".join(
+        day_name
+        for day_name, effective in zip("1234567", days[1:] + days[:1])
+        if effective
+    )
 
-    return value
+
+_TIME_STRINGS = tuple(f"{time//60:02d}:{time%60:02d}" for time in range(24 * 60))
 
 
 def _time_int_to_str(time):
+    if 0 <= time < len(_TIME_STRINGS):
+        return _TIME_STRINGS[time]
     return f"{time//60:02d}:{time%60:02d}"
 
 
-class HuaweiSolarTOUPricePeriodsSensorEntity(
-    CoordinatorEntity, HuaweiSolarEntity, SensorEntity
-):
+class HuaweiSolarTOUPricePeriodsSensorEntity(HuaweiSolarBaseSensorEntity):
     """Huawei Solar Sensor for configured TOU periods.
 
     It shows the number of configured TOU periods, and has the
     contents of them as extended attributes
     """
 
+    DESCRIPTION = HuaweiSolarSensorEntityDescription(
+        key=rn.STORAGE_HUAWEI_LUNA2000_TIME_OF_USE_CHARGING_AND_DISCHARGING_PERIODS,
+        icon="mdi:calendar-text",
+    )
+
     def __init__(
         self,
         coordinator: HuaweiSolarUpdateCoordinator,
@@ -1362,15 +1079,18 @@ class HuaweiSolarTOUPricePeriodsSensorEntity(
         )
         self.coordinator = coordinator
 
-        self.entity_description = HuaweiSolarSensorEntityDescription(
-            key=rn.STORAGE_HUAWEI_LUNA2000_TIME_OF_USE_CHARGING_AND_DISCHARGING_PERIODS,
-            icon="mdi:calendar-text",
-        )
+        self.entity_description = self.DESCRIPTION
 
         self._bridge = bridge
         self._attr_device_info = device_info
         self._attr_unique_id = f"{bridge.serial_number}_{self.entity_description.key}"
 
+        # The periods are only reformatted when they differ from the last update
+        self._periods: (
+            list[LG_RESU_TimeOfUsePeriod] | list[HUAWEI_LUNA2000_TimeOfUsePeriod] | None
+        ) = None
+        self._period_to_text: Callable[[Any], str] | None = None
+
     def _lg_resu_period_to_text(self, period: LG_RESU_TimeOfUsePeriod):
         return (
             f"{_time_int_to_str(period.start_time)}-{_time_int_to_str(period.end_time)}"
@@ -1384,51 +1104,65 @@ class HuaweiSolarTOUPricePeriodsSensorEntity(
             f"/{'+' if period.charge_flag == ChargeFlag.CHARGE else '-'}"
         )
 
+    def _update_extra_state_attributes(
+        self,
+        data: list[LG_RESU_TimeOfUsePeriod] | list[HUAWEI_LUNA2000_TimeOfUsePeriod],
+    ) -> None:
+        if len(data) == 0:
+            self._attr_extra_state_attributes.clear()
+            return
+
+        # The period type depends on the connected battery, so it never changes
+        if self._period_to_text is None:
+            self._period_to_text = (
+                self._lg_resu_period_to_text
+                if isinstance(data[0], LG_RESU_TimeOfUsePeriod)
+                else self._huawei_luna2000_period_to_text
+            )
+
+        self._attr_extra_state_attributes = {
+            f"Period {idx+1}": self._period_to_text(period)
+            for idx, period in enumerate(data)
+        }
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         if (
             self.coordinator.data
-            and self.entity_description.key in self.coordinator.data
+            and (result := self.coordinator.data.get(self.entity_description.key))
+            is not None
         ):
             self._attr_available = True
 
             data: (
                 list[LG_RESU_TimeOfUsePeriod] | list[HUAWEI_LUNA2000_TimeOfUsePeriod]
-            ) = self.coordinator.data[self.entity_description.key].value
+            ) = result.value
 
             self._attr_native_value = len(data)
 
-            if len(data) == 0:
-                self._attr_extra_state_attributes.clear()
-            elif isinstance(data[0], LG_RESU_TimeOfUsePeriod):
-                self._attr_extra_state_attributes = {
-                    f"Period {idx+1}": self._lg_resu_period_to_text(
-                        cast(LG_RESU_TimeOfUsePeriod, period)
-                    )
-                    for idx, period in enumerate(data)
-                }
-            elif isinstance(data[0], HUAWEI_LUNA2000_TimeOfUsePeriod):
-                self._attr_extra_state_attributes = {
-                    f"Period {idx+1}": self._huawei_luna2000_period_to_text(period)
-                    for idx, period in enumerate(data)
-                }
+            if data != self._periods:
+                self._periods = data
+                self._update_extra_state_attributes(data)
         else:
             self._attr_available = False
             self._attr_native_value = None
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
 
 
-class HuaweiSolarCapacityControlPeriodsSensorEntity(
-    CoordinatorEntity, HuaweiSolarEntity, SensorEntity
-):
+class HuaweiSolarCapacityControlPeriodsSensorEntity(HuaweiSolarBaseSensorEntity):
     """Huawei Solar Sensor for configured Capacity Control periods.
 
     It shows the number of configured capacity control periods, and has the
     contents of them as extended attributes
     """
 
+    DESCRIPTION = HuaweiSolarSensorEntityDescription(
+        key=rn.STORAGE_CAPACITY_CONTROL_PERIODS,
+        icon="mdi:calendar-text",
+    )
+
     def __init__(
         self,
         coordinator: HuaweiSolarUpdateCoordinator,
@@ -1441,15 +1175,15 @@ class HuaweiSolarCapacityControlPeriodsSensorEntity(
         )
         self.coordinator = coordinator
 
-        self.entity_description = HuaweiSolarSensorEntityDescription(
-            key=rn.STORAGE_CAPACITY_CONTROL_PERIODS,
-            icon="mdi:calendar-text",
-        )
+        self.entity_description = self.DESCRIPTION
 
         self._bridge = bridge
         self._attr_device_info = device_info
         self._attr_unique_id = f"{bridge.serial_number}_{self.entity_description.key}"
 
+        # The periods are only reformatted when they differ from the last update
+        self._periods: list[PeakSettingPeriod] | None = None
+
     def _period_to_text(self, psp: PeakSettingPeriod):
         return (
             f"{_time_int_to_str(psp.start_time)}"
@@ -1463,33 +1197,62 @@ class HuaweiSolarCapacityControlPeriodsSensorEntity(
         """Handle updated data from the coordinator."""
         if (
             self.coordinator.data
-            and self.entity_description.key in self.coordinator.data
+            and (result := self.coordinator.data.get(self.entity_description.key))
+            is not None
         ):
-            data: list[PeakSettingPeriod] = self.coordinator.data[
-                self.entity_description.key
-            ].value
+            data: list[PeakSettingPeriod] = result.value
 
             self._attr_available = True
             self._attr_native_value = len(data)
-            self._attr_extra_state_attributes = {
-                f"Period {idx+1}": self._period_to_text(period)
-                for idx, period in enumerate(data)
-            }
+            if data != self._periods:
+                self._periods = data
+                self._attr_extra_state_attributes = {
+                    f"Period {idx+1}": self._period_to_text(period)
+                    for idx, period in enumerate(data)
+                }
         else:
             self._attr_available = False
             self._attr_native_value = None
             self._attr_extra_state_attributes.clear()
-
-        self.async_write_ha_state()
-
-
-class HuaweiSolarForcibleChargeEntity(
-    CoordinatorEntity, HuaweiSolarEntity, SensorEntity
-):
+            self._periods = None
+
+        self.async_write_ha_state_if_changed()
+
+
+# The library's IntEnums of different types share values, hence typed=True
+@lru_cache(maxsize=64, typed=True)
+def _register_value_to_str(value: Any) -> str:
+    return str(value)
+
+
+# Summary of the forcible charge status, keyed by (mode, whether the target is a SoC)
+_FORCIBLE_CHARGE_SUMMARIES = {
+    (rv.StorageForcibleChargeDischarge.STOP, True): "Stopped",
+    (rv.StorageForcibleChargeDischarge.STOP, False): "Stopped",
+    (
+        rv.StorageForcibleChargeDischarge.CHARGE,
+        True,
+    ): "Charging at {charge_power}W until {target_soc}%",
+    (
+        rv.StorageForcibleChargeDischarge.CHARGE,
+        False,
+    ): "Charging at {charge_power}W for {duration} minutes",
+    (
+        rv.StorageForcibleChargeDischarge.DISCHARGE,
+        True,
+    ): "Discharging at {discharge_power}W until {target_soc}%",
+    (
+        rv.StorageForcibleChargeDischarge.DISCHARGE,
+        False,
+    ): "Discharging at {discharge_power}W for {duration} minutes",
+}
+
+
+class HuaweiSolarForcibleChargeEntity(HuaweiSolarBaseSensorEntity):
     """Huawei Solar Sensor for the current forcible charge status."""
-    
+
     _attr_extra_state_attributes : dict[str, Any] = {}
-    
+
     REGISTER_NAMES = [
         rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE,  # is SoC or time the target?
         rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE,  # stop/charging/discharging
@@ -1498,6 +1261,13 @@ class HuaweiSolarForcibleChargeEntity(
         rn.STORAGE_FORCED_CHARGING_AND_DISCHARGING_PERIOD,
         rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SOC,
     ]
+    REGISTER_NAMES_SET = frozenset(REGISTER_NAMES)
+
+    DESCRIPTION = HuaweiSolarSensorEntityDescription(
+        key=rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE,
+        icon="mdi:battery-charging-medium",
+        translation_key="forcible_charge_summary",
+    )
 
     def __init__(
         self,
@@ -1512,11 +1282,7 @@ class HuaweiSolarForcibleChargeEntity(
         )
         self.coordinator = coordinator
 
-        self.entity_description = HuaweiSolarSensorEntityDescription(
-            key=rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE,
-            icon="mdi:battery-charging-medium",
-            translation_key="forcible_charge_summary",
-        )
+        self.entity_description = self.DESCRIPTION
 
         self._bridge = bridge
         self._attr_device_info = device_info
@@ -1525,46 +1291,29 @@ class HuaweiSolarForcibleChargeEntity(
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if (
-            self.coordinator.data
-            and set(self.REGISTER_NAMES) <= self.coordinator.data.keys()
-        ):
-            mode = self.coordinator.data[
-                rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE
-            ].value
-            setting = self.coordinator.data[
-                rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE
-            ].value
-            charge_power = self.coordinator.data[rn.STORAGE_FORCIBLE_CHARGE_POWER].value
-            discharge_power = self.coordinator.data[
-                rn.STORAGE_FORCIBLE_DISCHARGE_POWER
-            ].value
-            target_soc = self.coordinator.data[
-                rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SOC
-            ].value
-            duration = self.coordinator.data[
-                rn.STORAGE_FORCED_CHARGING_AND_DISCHARGING_PERIOD
-            ].value
-
-            if mode == rv.StorageForcibleChargeDischarge.STOP:
-                value = "Stopped"
-            elif mode == rv.StorageForcibleChargeDischarge.CHARGE:
-                if setting == rv.StorageForcibleChargeDischargeTargetMode.SOC:
-                    value = f"Charging at {charge_power}W until {target_soc}%"
-                else:
-                    value = f"Charging at {charge_power}W for {duration} minutes"
-            else:
-                assert mode == rv.StorageForcibleChargeDischarge.DISCHARGE
-                if setting == rv.StorageForcibleChargeDischargeTargetMode.SOC:
-                    value = f"Discharging at {discharge_power}W until {target_soc}%"
-                else:
-                    value = f"Discharging at {discharge_power}W for {duration} minutes"
+        data = self.coordinator.data
+        if data and self.REGISTER_NAMES_SET <= data.keys():
+            mode = data[rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE].value
+            setting = data[rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE].value
+            charge_power = data[rn.STORAGE_FORCIBLE_CHARGE_POWER].value
+            discharge_power = data[rn.STORAGE_FORCIBLE_DISCHARGE_POWER].value
+            target_soc = data[rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SOC].value
+            duration = data[rn.STORAGE_FORCED_CHARGING_AND_DISCHARGING_PERIOD].value
+
+            value = _FORCIBLE_CHARGE_SUMMARIES[
+                mode, setting == rv.StorageForcibleChargeDischargeTargetMode.SOC
+            ].format(
+                charge_power=charge_power,
+                discharge_power=discharge_power,
+                target_soc=target_soc,
+                duration=duration,
+            )
 
             self._attr_available = True
             self._attr_native_value = value
             self._attr_extra_state_attributes = {
-                "mode": str(mode),
-                "setting": str(setting),
+                "mode": _register_value_to_str(mode),
+                "setting": _register_value_to_str(setting),
                 "charge_power": charge_power,
                 "discharge_power": discharge_power,
                 "target_soc": target_soc,
@@ -1574,12 +1323,23 @@ class HuaweiSolarForcibleChargeEntity(
             self._attr_available = False
             self._attr_native_value = None
             self._attr_extra_state_attributes.clear()
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
+
 
+_ACTIVE_POWER_CONTROL_SUMMARIES = {
+    rv.ActivePowerControlMode.UNLIMITED: "Unlimited",
+    rv.ActivePowerControlMode.POWER_LIMITED_GRID_CONNECTION_PERCENT: (
+        "Limited to {maximum_power_percent}%"
+    ),
+    rv.ActivePowerControlMode.POWER_LIMITED_GRID_CONNECTION_WATT: (
+        "Limited to {maximum_power_watt}W"
+    ),
+    rv.ActivePowerControlMode.ZERO_POWER_GRID_CONNECTION: "Zero Power",
+    rv.ActivePowerControlMode.DI_ACTIVE_SCHEDULING: "DI Active Scheduling",
+}
 
-class HuaweiSolarActivePowerControlModeEntity(
-    CoordinatorEntity, HuaweiSolarEntity, SensorEntity
-):
+
+class HuaweiSolarActivePowerControlModeEntity(HuaweiSolarBaseSensorEntity):
     """Huawei Solar Sensor for the current forcible charge status."""
 
     REGISTER_NAMES = [
@@ -1587,6 +1347,15 @@ class HuaweiSolarActivePowerControlModeEntity(
         rn.MAXIMUM_FEED_GRID_POWER_WATT,
         rn.MAXIMUM_FEED_GRID_POWER_PERCENT,
     ]
+    REGISTER_NAMES_SET = frozenset(REGISTER_NAMES)
+
+    DESCRIPTION = HuaweiSolarSensorEntityDescription(
+        key=rn.ACTIVE_POWER_CONTROL_MODE,
+        translation_key="active_power_control",
+        icon="mdi:transmission-tower",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    )
 
     def __init__(
         self,
@@ -1601,13 +1370,7 @@ class HuaweiSolarActivePowerControlModeEntity(
         )
         self.coordinator = coordinator
 
-        self.entity_description = HuaweiSolarSensorEntityDescription(
-            key=rn.ACTIVE_POWER_CONTROL_MODE,
-            translation_key="active_power_control",
-            icon="mdi:transmission-tower",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            entity_registry_enabled_default=False,
-        )
+        self.entity_description = self.DESCRIPTION
 
         self._bridge = bridge
         self._attr_device_info = device_info
@@ -1616,37 +1379,21 @@ class HuaweiSolarActivePowerControlModeEntity(
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if (
-            self.coordinator.data
-            and set(self.REGISTER_NAMES) <= self.coordinator.data.keys()
-        ):
-            mode = self.coordinator.data[rn.ACTIVE_POWER_CONTROL_MODE].value
-            maximum_power_watt = self.coordinator.data[
-                rn.MAXIMUM_FEED_GRID_POWER_WATT
-            ].value
-            maximum_power_percent = self.coordinator.data[
-                rn.MAXIMUM_FEED_GRID_POWER_PERCENT
-            ].value
-
-            if mode == rv.ActivePowerControlMode.UNLIMITED:
-                value = "Unlimited"
-            elif (
-                mode == rv.ActivePowerControlMode.POWER_LIMITED_GRID_CONNECTION_PERCENT
-            ):
-                value = f"Limited to {maximum_power_percent}%"
-            elif mode == rv.ActivePowerControlMode.POWER_LIMITED_GRID_CONNECTION_WATT:
-                value = f"Limited to {maximum_power_watt}W"
-            elif mode == rv.ActivePowerControlMode.ZERO_POWER_GRID_CONNECTION:
-                value = "Zero Power"
-            elif mode == rv.ActivePowerControlMode.DI_ACTIVE_SCHEDULING:
-                value = "DI Active Scheduling"
-            else:
-                value = "Unknown"
+        data = self.coordinator.data
+        if data and self.REGISTER_NAMES_SET <= data.keys():
+            mode = data[rn.ACTIVE_POWER_CONTROL_MODE].value
+            maximum_power_watt = data[rn.MAXIMUM_FEED_GRID_POWER_WATT].value
+            maximum_power_percent = data[rn.MAXIMUM_FEED_GRID_POWER_PERCENT].value
+
+            value = _ACTIVE_POWER_CONTROL_SUMMARIES.get(mode, "Unknown").format(
+                maximum_power_watt=maximum_power_watt,
+                maximum_power_percent=maximum_power_percent,
+            )
 
             self._attr_available = True
             self._attr_native_value = value
             self._attr_extra_state_attributes = {
-                "mode": str(mode),
+                "mode": _register_value_to_str(mode),
                 "maximum_power_watt": maximum_power_watt,
                 "maximum_power_percent": maximum_power_percent,
             }
@@ -1654,12 +1401,10 @@ class HuaweiSolarActivePowerControlModeEntity(
             self._attr_available = False
             self._attr_native_value = None
             self._attr_extra_state_attributes.clear()
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
 
 
-class HuaweiSolarOptimizerSensorEntity(
-    CoordinatorEntity, HuaweiSolarEntity, SensorEntity
-):
+class HuaweiSolarOptimizerSensorEntity(HuaweiSolarBaseSensorEntity):
     """Huawei Solar Optimizer Sensor which receives its data via an DataUpdateCoordinator."""
 
     entity_description: HuaweiSolarSensorEntityDescription
@@ -1680,57 +1425,57 @@ class HuaweiSolarOptimizerSensorEntity(
 
         self._attr_device_info = device_info
         self._attr_unique_id = f"{device_info['name']}_{description.key}"
+        self._value_getter = attrgetter(description.key)
+        self._value_conversion_function = description.value_conversion_function
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        entry = self.coordinator.data.get(self.optimizer_id)
+        key = self.entity_description.key
         self._attr_available = (
-            self.optimizer_id in self.coordinator.data
+            entry is not None
             # Optimizer data fields only return sensible data when the
             # optimizer is not offline
             and (
-                self.entity_description.key == "running_status"
-                or self.coordinator.data[self.optimizer_id].running_status
-                != OptimizerRunningStatus.OFFLINE
+                key == "running_status"
+                or entry.running_status != OptimizerRunningStatus.OFFLINE
             )
         )
 
-        if self.optimizer_id in self.coordinator.data:
-            value = getattr(
-                self.coordinator.data[self.optimizer_id], self.entity_description.key
-            )
-            if self.entity_description.value_conversion_function:
-                value = self.entity_description.value_conversion_function(value)
+        if entry is not None:
+            value = self._value_getter(entry)
+            if self._value_conversion_function:
+                value = self._value_conversion_function(value)
 
             self._attr_native_value = value
 
         else:
             self._attr_native_value = None
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
+
+
+_PV_STRING_REGISTER_NAMES = tuple(
+    (getattr(rn, f"PV_{idx:02}_VOLTAGE"), getattr(rn, f"PV_{idx:02}_CURRENT"))
+    for idx in range(1, 25)
+)
 
 
-def get_pv_entity_descriptions(count: int) -> list[HuaweiSolarSensorEntityDescription]:
+@lru_cache(maxsize=len(_PV_STRING_REGISTER_NAMES))
+def get_pv_entity_descriptions(
+    count: int,
+) -> tuple[HuaweiSolarSensorEntityDescription, ...]:
     """Create the entity descriptions for a PV string."""
-    assert 1 <= count <= 24
-    result = []
+    assert 1 <= count <= len(_PV_STRING_REGISTER_NAMES)
+    result: list[HuaweiSolarSensorEntityDescription] = []
 
-    for idx in range(1, count + 1):
+    for voltage_register, current_register in _PV_STRING_REGISTER_NAMES[:count]:
         result.extend(
             [
-                HuaweiSolarSensorEntityDescription(
-                    key=getattr(rn, f"PV_{idx:02}_VOLTAGE"),
-                    native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-                    device_class=SensorDeviceClass.VOLTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                ),
-                HuaweiSolarSensorEntityDescription(
-                    key=getattr(rn, f"PV_{idx:02}_CURRENT"),
-                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                    device_class=SensorDeviceClass.CURRENT,
-                    state_class=SensorStateClass.MEASUREMENT,
-                ),
+                _voltage_description(voltage_register),
+                _current_description(current_register),
             ]
         )
 
-    return result
+    return tuple(result)